@@ -1,5 +1,34 @@
 include(CMakeParseArguments)
 
+# Install the Modelica Standard Library once, before any FMU build runs, so
+# parallel omc processes never install into the same user library directory.
+function(_add_modelica_library_target)
+  if(TARGET modelica_library)
+    return()
+  endif()
+
+  set(install_mos "${CMAKE_BINARY_DIR}/mos/install_modelica.mos")
+  set(install_stamp "${CMAKE_BINARY_DIR}/mos/install_modelica.stamp")
+  # omc exits 0 on failed calls, so exit explicitly to keep the stamp from
+  # being touched and retry the install on the next build.
+  file(GENERATE OUTPUT "${install_mos}" CONTENT
+"if not installPackage(Modelica, \"4.0.0\", exactMatch=false) then
+  print(getErrorString());
+  exit(1);
+end if;
+")
+
+  add_custom_command(
+    OUTPUT "${install_stamp}"
+    COMMAND "${OMC_EXECUTABLE}" "${install_mos}"
+    COMMAND "${CMAKE_COMMAND}" -E touch "${install_stamp}"
+    DEPENDS "${install_mos}"
+    WORKING_DIRECTORY "${PROJECT_SOURCE_DIR}"
+    VERBATIM
+  )
+  add_custom_target(modelica_library DEPENDS "${install_stamp}")
+endfunction()
+
 function(add_modelica_fmu)
   set(options)
   set(one_value_args TARGET MODEL OUTPUT_NAME)
@@ -28,7 +57,9 @@ function(add_modelica_fmu)
 
   set(output_fmu "${output_root}/${AMF_OUTPUT_NAME}.fmu")
   set(work_dir "${tmp_root}/${AMF_TARGET}")
-  set(mos_file "${tmp_root}/${AMF_TARGET}.mos")
+  # Keep the configure-time script out of the scratch root so wiping scratch
+  # space (e.g. a tmpfs) cannot remove a build dependency.
+  set(mos_file "${CMAKE_BINARY_DIR}/mos/${AMF_TARGET}.mos")
   set(load_lines "")
   set(package_deps "")
 
@@ -45,8 +76,7 @@ function(add_modelica_fmu)
   list(REMOVE_DUPLICATES package_deps)
 
   file(GENERATE OUTPUT "${mos_file}" CONTENT
-"installPackage(Modelica, \"4.0.0\", exactMatch=false);
-${load_lines}cd(\"${work_dir}\");
+"${load_lines}cd(\"${work_dir}\");
 setCommandLineOptions(\"--fmiFlags=s:cvode\");
 setCommandLineOptions(\"--fmuRuntimeDepends=all\");
 filename := OpenModelica.Scripting.buildModelFMU(${AMF_MODEL}, version=\"2.0\", fmuType=\"cs\", platforms={\"static\"});
@@ -70,5 +100,7 @@ getErrorString();
     VERBATIM
   )
 
+  _add_modelica_library_target()
   add_custom_target("${AMF_TARGET}" DEPENDS "${output_fmu}")
+  add_dependencies("${AMF_TARGET}" modelica_library)
 endfunction()
@@ -19,9 +19,11 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
+    from pycps_sysmlv2 import SysMLParser
+
     from scripts.lib.artifacts.sysml_export.c_headers import generate_headers
 
-    written = generate_headers(args.architecture, args.output_dir)
+    written = generate_headers(SysMLParser(args.architecture).parse(), args.output_dir)
     print(f"Wrote {len(written)} interface headers to {args.output_dir}")
     return 0
 
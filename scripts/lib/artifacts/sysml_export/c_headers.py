@@ -3,28 +3,25 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from pycps_sysmlv2 import NodeType, SysMLParser
-
 from scripts.lib.common.sysml import (
     architecture_part_specs,
     part_instance_fields,
     port_struct_fields,
     sanitize_c_identifier,
 )
-from scripts.lib.paths import ARCHITECTURE_DIR, COMPOSITION_NAME, GENERATED_DIR, ensure_directory
+from scripts.lib.paths import (
+    ARCHITECTURE_DIR,
+    COMPOSITION_NAME,
+    GENERATED_DIR,
+    common_header_name,
+    ensure_directory,
+    part_header_name,
+)
 
 DEFAULT_ARCH_PATH = ARCHITECTURE_DIR
 DEFAULT_OUTPUT_DIR = GENERATED_DIR / "interfaces"
 
 
-def common_header_name(package: str) -> str:
-    return f"{package}_InterfaceCommon.h"
-
-
-def part_header_name(package: str, part_name: str) -> str:
-    return f"{package}_{part_name}.h"
-
-
 def _cpp_type_tag(package: str, fmi_type: str) -> str:
     return f"{package.upper()}_DATA_{fmi_type.upper()}"
 
@@ -128,8 +125,7 @@ def _part_header_lines(package: str, part_name: str, part, specs: list) -> list[
     return lines
 
 
-def generate_headers(source: Path, output_dir: Path) -> list[Path]:
-    architecture = SysMLParser(source).parse()
+def generate_headers(architecture, output_dir: Path) -> list[Path]:
     part_specs = architecture_part_specs(architecture)
 
     ensure_directory(output_dir)
@@ -52,7 +52,7 @@ def export_artifacts(
     ensure_parent_dir(interface_output)
     interface_output.write_text(generate_modelica_package(architecture.port_definitions), encoding="utf-8")
 
-    generate_headers(architecture_path, generated_dir / "interfaces")
+    generate_headers(architecture, generated_dir / "interfaces")
     model_descriptions = generate_model_descriptions(
         architecture_path,
         generated_dir / "model_descriptions",
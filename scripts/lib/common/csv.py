@@ -24,18 +24,26 @@ def numeric_series(
     rows: Sequence[Dict[str, str]], key: str, cast=float
 ) -> List[float]:
     values: List[float] = []
+    append = values.append
     for row in rows:
         raw = row.get(key, "")
-        if raw is None:
+        if raw is None or raw == "":
             continue
+        # float()/int() already ignore surrounding whitespace, so well-formed
+        # cells take a single conversion; only failures are cleaned up.
+        try:
+            append(cast(raw))
+            continue
+        except (TypeError, ValueError):
+            pass
         raw_str = str(raw).strip()
         if not raw_str:
             continue
         try:
-            values.append(cast(raw_str))
+            append(cast(raw_str))
         except ValueError:
             try:
-                values.append(cast(raw_str.replace(",", "")))
+                append(cast(raw_str.replace(",", "")))
             except ValueError:
                 continue
     return values
@@ -50,7 +58,12 @@ def read_result_rows(result_file: Path) -> List[Dict[str, str]]:
 def series_from_candidates(
     rows: Sequence[Dict[str, str]], keys: Sequence[str], cast=float
 ) -> List[float]:
+    # Rows from read_result_rows all share the CSV header, so candidates that
+    # are not columns are skipped without scanning every row.
+    header = rows[0].keys() if rows else ()
     for key in keys:
+        if key not in header:
+            continue
         series = numeric_series(rows, key, cast=cast)
         if series:
             return series
@@ -2,25 +2,26 @@
 from __future__ import annotations
 
 import math
-from typing import Dict, List
+from typing import Dict, List, Sequence, Tuple
 
 EARTH_RADIUS_KM = 6371.0
+# Same factors math.radians/math.degrees use, without the per-call dispatch.
+DEG_TO_RAD = math.pi / 180.0
+RAD_TO_DEG = 180.0 / math.pi
 
 
 def haversine_distance_km(points: List[Dict[str, float]]) -> float:
     """Compute total surface distance of consecutive latitude/longitude points."""
+    # Convert every point once; each interior point is shared by two legs.
+    coords = [
+        (float(p["latitude_deg"]) * DEG_TO_RAD, float(p["longitude_deg"]) * DEG_TO_RAD)
+        for p in points
+    ]
     total = 0.0
-    for i in range(len(points) - 1):
-        lat1 = math.radians(float(points[i]["latitude_deg"]))
-        lon1 = math.radians(float(points[i]["longitude_deg"]))
-        lat2 = math.radians(float(points[i + 1]["latitude_deg"]))
-        lon2 = math.radians(float(points[i + 1]["longitude_deg"]))
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        h = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-        )
+    for (lat1, lon1), (lat2, lon2) in zip(coords, coords[1:]):
+        sin_dlat = math.sin((lat2 - lat1) * 0.5)
+        sin_dlon = math.sin((lon2 - lon1) * 0.5)
+        h = sin_dlat * sin_dlat + math.cos(lat1) * math.cos(lat2) * sin_dlon * sin_dlon
         total += 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
     return total
 
@@ -29,41 +30,47 @@ def destination_point(
     latitude_deg: float, longitude_deg: float, distance_km: float, bearing_rad: float
 ) -> Dict[str, float]:
     """Compute the destination geodetic point from a start, distance, and bearing."""
-    lat1 = math.radians(latitude_deg)
-    lon1 = math.radians(longitude_deg)
+    lat1 = latitude_deg * DEG_TO_RAD
+    lon1 = longitude_deg * DEG_TO_RAD
     ang_dist = distance_km / EARTH_RADIUS_KM
-    sin_lat2 = (
-        math.sin(lat1) * math.cos(ang_dist)
-        + math.cos(lat1) * math.sin(ang_dist) * math.cos(bearing_rad)
-    )
-    lat2 = math.asin(max(-1.0, min(1.0, sin_lat2)))
-    y = math.sin(bearing_rad) * math.sin(ang_dist) * math.cos(lat1)
-    x = math.cos(ang_dist) - math.sin(lat1) * math.sin(lat2)
+    sin_lat1 = math.sin(lat1)
+    cos_lat1 = math.cos(lat1)
+    sin_ang = math.sin(ang_dist)
+    cos_ang = math.cos(ang_dist)
+    sin_lat2 = max(-1.0, min(1.0, sin_lat1 * cos_ang + cos_lat1 * sin_ang * math.cos(bearing_rad)))
+    y = math.sin(bearing_rad) * sin_ang * cos_lat1
+    # sin(asin(v)) == v, so the clamped value stands in for sin(lat2).
+    x = cos_ang - sin_lat1 * sin_lat2
     lon2 = lon1 + math.atan2(y, x)
     lon2 = (lon2 + math.pi) % (2 * math.pi) - math.pi
     return {
-        "latitude_deg": math.degrees(lat2),
-        "longitude_deg": math.degrees(lon2),
+        "latitude_deg": math.asin(sin_lat2) * RAD_TO_DEG,
+        "longitude_deg": lon2 * RAD_TO_DEG,
     }
 
 
+def project_lat_lon_to_local_km(
+    lats: Sequence[float], lons: Sequence[float]
+) -> Tuple[List[float], List[float]]:
+    """Project latitude/longitude series to local X/Y km relative to the first sample."""
+    if not lats or not lons:
+        return [], []
+    lat0 = lats[0]
+    lon0 = lons[0]
+    y_scale = 111.0 * math.cos(lat0 * DEG_TO_RAD)
+    return [111.0 * (lat - lat0) for lat in lats], [y_scale * (lon - lon0) for lon in lons]
+
+
 def project_waypoints_to_local_km(points: List[Dict[str, float]]) -> List[Dict[str, float]]:
     """Convert geodetic latitude/longitude/altitude to a local X/Y/Z frame in km."""
-    if not points:
-        return []
-    origin = points[0]
-    lat0 = float(origin["latitude_deg"])
-    lon0 = float(origin["longitude_deg"])
-    lat0_rad = math.radians(lat0)
-    projected: List[Dict[str, float]] = []
-    for point in points:
-        lat = float(point["latitude_deg"])
-        lon = float(point["longitude_deg"])
-        alt_m = float(point.get("altitude_m", 0.0))
-        x_km = 111.0 * (lat - lat0)
-        y_km = 111.0 * math.cos(lat0_rad) * (lon - lon0)
-        projected.append({"x_km": x_km, "y_km": y_km, "z_km": alt_m / 1000.0})
-    return projected
+    xs, ys = project_lat_lon_to_local_km(
+        [float(point["latitude_deg"]) for point in points],
+        [float(point["longitude_deg"]) for point in points],
+    )
+    return [
+        {"x_km": x_km, "y_km": y_km, "z_km": float(point.get("altitude_m", 0.0)) / 1000.0}
+        for point, x_km, y_km in zip(points, xs, ys)
+    ]
 
 
 def local_path_distance_km(points: List[Dict[str, float]]) -> float:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, Iterable, List, Optional
 
 from pycps_sysmlv2 import NodeType, SysMLPartDefinition, SysMLPortDefinition
@@ -10,8 +11,25 @@ from scripts.lib.paths import COMPOSITION_NAME
 from scripts.lib.common.sysml.type_utils import infer_primitive, normalize_primitive
 from scripts.lib.common.sysml.values import parse_literal
 
+C_PRIMITIVE_TYPES = MappingProxyType(
+    {
+        "Real": "double",
+        "Integer": "int",
+        "Boolean": "bool",
+        "String": "const char*",
+    }
+)
+CPP_MEMBER_TYPES = MappingProxyType(
+    {
+        "Real": "double",
+        "Integer": "int",
+        "Boolean": "bool",
+        "String": "std::string",
+    }
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class VariableSpec:
     name: str
     value_reference: int
@@ -25,33 +43,15 @@ class VariableSpec:
 
 
 def c_primitive(type_name: str) -> str:
-    primitive = normalize_primitive(type_name)
-    return {
-        "Real": "double",
-        "Integer": "int",
-        "Boolean": "bool",
-        "String": "const char*",
-    }.get(primitive, "double")
+    return C_PRIMITIVE_TYPES[normalize_primitive(type_name)]
 
 
 def cpp_member_type(type_name: str) -> str:
-    primitive = normalize_primitive(type_name)
-    return {
-        "Real": "double",
-        "Integer": "int",
-        "Boolean": "bool",
-        "String": "std::string",
-    }.get(primitive, "double")
+    return CPP_MEMBER_TYPES[normalize_primitive(type_name)]
 
 
 def sanitize_c_identifier(name: str) -> str:
-    chars = []
-    for char in name:
-        if char.isalnum():
-            chars.append(char.upper())
-        else:
-            chars.append("_")
-    return "".join(chars)
+    return "".join(char.upper() if char.isalnum() else "_" for char in name)
 
 
 def port_struct_fields(port_def: SysMLPortDefinition) -> List[tuple[str, str]]:
@@ -75,13 +75,18 @@ def format_cpp_default(type_name: str, value: object | None) -> str:
     return str(value)
 
 
+def _attribute_types(attr) -> tuple[object, str, str]:
+    literal = parse_literal(attr.value)
+    primitive = infer_primitive(attr.type, literal)
+    return literal, primitive, attr.type.as_string() or primitive
+
+
 def part_variable_specs(part: SysMLPartDefinition) -> List[VariableSpec]:
     specs: List[VariableSpec] = []
     value_reference = 0
 
     for attr in part.defs(NodeType.Attribute).values():
-        literal = parse_literal(attr.value)
-        primitive = infer_primitive(attr.type, literal)
+        literal, primitive, type_name = _attribute_types(attr)
         start_value = None
         if literal is not None and not isinstance(literal, list):
             if primitive == "Boolean":
@@ -96,8 +101,8 @@ def part_variable_specs(part: SysMLPartDefinition) -> List[VariableSpec]:
                 causality="parameter",
                 variability="fixed",
                 start_value=start_value,
-                c_member_type=c_primitive(attr.type.as_string() or primitive),
-                cpp_member_type=cpp_member_type(attr.type.as_string() or primitive),
+                c_member_type=c_primitive(type_name),
+                cpp_member_type=cpp_member_type(type_name),
                 field_path=attr.name,
             )
         )
@@ -107,15 +112,17 @@ def part_variable_specs(part: SysMLPartDefinition) -> List[VariableSpec]:
         payload = port.ref_node
         if payload is None:
             continue
+        causality = "input" if port.direction == "in" else "output"
         for attr in payload.defs(NodeType.Attribute).values():
+            type_name = attr.type.as_string() or "Real"
             specs.append(
                 VariableSpec(
                     name=f"{port.name}.{attr.name}",
                     value_reference=value_reference,
                     fmi_type=normalize_primitive(attr.type),
-                    causality="input" if port.direction == "in" else "output",
-                    c_member_type=c_primitive(attr.type.as_string() or "Real"),
-                    cpp_member_type=cpp_member_type(attr.type.as_string() or "Real"),
+                    causality=causality,
+                    c_member_type=c_primitive(type_name),
+                    cpp_member_type=cpp_member_type(type_name),
                     field_path=f"{port.name}.{attr.name}",
                 )
             )
@@ -143,13 +150,12 @@ def output_indexes(specs: Iterable[VariableSpec]) -> List[int]:
 def part_instance_fields(package: str, part: SysMLPartDefinition) -> List[tuple[str, str, str]]:
     fields: List[tuple[str, str, str]] = []
     for attr in part.defs(NodeType.Attribute).values():
-        literal = parse_literal(attr.value)
-        primitive = infer_primitive(attr.type, literal)
+        literal, _, type_name = _attribute_types(attr)
         fields.append(
             (
-                cpp_member_type(attr.type.as_string() or primitive),
+                cpp_member_type(type_name),
                 attr.name,
-                format_cpp_default(attr.type.as_string() or primitive, literal),
+                format_cpp_default(type_name, literal),
             )
         )
     for port in part.refs(NodeType.Port).values():
@@ -1,9 +1,10 @@
 """Helpers for normalizing SysML primitive type names."""
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Optional
 
-PRIMITIVE_TYPE_MAP = {
+PRIMITIVE_TYPE_MAP = MappingProxyType({
     "real": "Real",
     "float": "Real",
     "float32": "Real",
@@ -18,7 +19,7 @@ PRIMITIVE_TYPE_MAP = {
     "boolean": "Boolean",
     "bool": "Boolean",
     "string": "String",
-}
+})
 
 
 def _type_key(type_name: Optional[object]) -> Optional[str]:
@@ -14,8 +14,8 @@ def normalize_model_description_timestamps(paths: list[Path]) -> list[Path]:
         tree = ET.parse(path)
         root = tree.getroot()
         root.set("generationDateAndTime", FIXED_GENERATION_TIMESTAMP)
-        ET.indent(tree, space="  ", level=0)
-        tree.write(path, encoding="utf-8", xml_declaration=True)
+        ET.indent(root, space="  ", level=0)
+        path.write_bytes(ET.tostring(root, encoding="utf-8", xml_declaration=True))
     return paths
 
 
@@ -189,12 +189,11 @@ MODELICA_MODEL_SPECS = [
 
 DEFAULT_MODELICA_MODELS = [spec.model_name for spec in MODELICA_MODEL_SPECS]
 
+_MODELICA_MODEL_SPECS_BY_NAME = {spec.model_name: spec for spec in MODELICA_MODEL_SPECS}
+
 
 def spec_by_model_name(model_name: str) -> ModelicaModelSpec:
-    for spec in MODELICA_MODEL_SPECS:
-        if spec.model_name == model_name:
-            return spec
-    raise KeyError(model_name)
+    return _MODELICA_MODEL_SPECS_BY_NAME[model_name]
 
 
 def ensure_directory(path: Path) -> Path:
@@ -2,21 +2,25 @@
 from __future__ import annotations
 
 import json
-import math
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from scripts.lib.common.geo import project_waypoints_to_local_km
+from scripts.lib.common.geo import project_lat_lon_to_local_km, project_waypoints_to_local_km
 from scripts.lib.common.csv import numeric_series, read_result_rows, series_from_candidates
 from scripts.lib.results.track import extract_track_points
 
 
-def plot_flight_path(
-    result_file: Path, scenario_points: List[Dict[str, float]], output_path: Path
-) -> Optional[Path]:
+def _pyplot():
+    """Return pyplot on the Agg backend, or None when plots are skipped or unavailable."""
     if os.environ.get("SIM_SKIP_PLOTS") == "1":
         return None
+    return _load_pyplot()
+
+
+@lru_cache(maxsize=1)
+def _load_pyplot():
     try:
         import matplotlib
 
@@ -24,8 +28,22 @@ def plot_flight_path(
         import matplotlib.pyplot as plt
     except Exception:
         return None
+    return plt
+
+
+def plot_flight_path(
+    result_file: Path,
+    scenario_points: List[Dict[str, float]],
+    output_path: Path,
+    *,
+    rows: Optional[List[Dict[str, str]]] = None,
+) -> Optional[Path]:
+    plt = _pyplot()
+    if plt is None:
+        return None
 
-    rows = read_result_rows(result_file)
+    if rows is None:
+        rows = read_result_rows(result_file)
     xs = series_from_candidates(
         rows,
         [
@@ -57,11 +75,7 @@ def plot_flight_path(
             ],
         )
         if lats and lons:
-            lat0 = lats[0]
-            lon0 = lons[0]
-            lat0_rad = math.radians(lat0)
-            xs = [111.0 * (lat - lat0) for lat in lats]
-            ys = [111.0 * math.cos(lat0_rad) * (lon - lon0) for lon in lons]
+            xs, ys = project_lat_lon_to_local_km(lats, lons)
 
     if not xs or not ys:
         return None
@@ -86,20 +100,22 @@ def plot_flight_path(
 
 
 def plot_flight_path_3d(
-    result_file: Path, scenario_points: List[Dict[str, float]], output_path: Path
+    result_file: Path,
+    scenario_points: List[Dict[str, float]],
+    output_path: Path,
+    *,
+    rows: Optional[List[Dict[str, str]]] = None,
 ) -> Optional[Path]:
-    if os.environ.get("SIM_SKIP_PLOTS") == "1":
+    plt = _pyplot()
+    if plt is None:
         return None
     try:
-        import matplotlib
-
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
         from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
     except Exception:
         return None
 
-    rows = read_result_rows(result_file)
+    if rows is None:
+        rows = read_result_rows(result_file)
     track_points = extract_track_points(rows)
     if not track_points:
         return None
@@ -127,18 +143,18 @@ def plot_flight_path_3d(
     return output_path
 
 
-def plot_fuel_altitude_time(result_file: Path, output_path: Path) -> Optional[Path]:
-    if os.environ.get("SIM_SKIP_PLOTS") == "1":
-        return None
-    try:
-        import matplotlib
-
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-    except Exception:
+def plot_fuel_altitude_time(
+    result_file: Path,
+    output_path: Path,
+    *,
+    rows: Optional[List[Dict[str, str]]] = None,
+) -> Optional[Path]:
+    plt = _pyplot()
+    if plt is None:
         return None
 
-    rows = read_result_rows(result_file)
+    if rows is None:
+        rows = read_result_rows(result_file)
     time_series = numeric_series(rows, "time")
     altitude_km = series_from_candidates(
         rows,
@@ -230,20 +246,24 @@ def generate_plots(
     scenario_points = _load_scenario_points(scenario)
     stem = results_csv.stem.replace("_results", "")
 
+    # Parse the CSV once and share the rows across every requested plot.
+    wants_plots = (plot_path or plot_3d or plot_fuel_altitude) and _pyplot() is not None
+    rows = read_result_rows(results_csv) if wants_plots else None
+
     generated: Dict[str, Optional[str]] = {}
     if plot_path:
         path_out = output_dir / f"{stem}_path.png"
-        plotted = plot_flight_path(results_csv, scenario_points, path_out)
+        plotted = plot_flight_path(results_csv, scenario_points, path_out, rows=rows)
         if plotted:
             generated["plot_path"] = str(plotted)
     if plot_3d:
         path3d_out = output_dir / f"{stem}_path3d.png"
-        plotted3d = plot_flight_path_3d(results_csv, scenario_points, path3d_out)
+        plotted3d = plot_flight_path_3d(results_csv, scenario_points, path3d_out, rows=rows)
         if plotted3d:
             generated["plot3d_path"] = str(plotted3d)
     if plot_fuel_altitude:
         fuel_alt_out = output_dir / f"{stem}_fuel_altitude.png"
-        plotted_fuel = plot_fuel_altitude_time(results_csv, fuel_alt_out)
+        plotted_fuel = plot_fuel_altitude_time(results_csv, fuel_alt_out, rows=rows)
         if plotted_fuel:
             generated["plot_fuel_altitude_path"] = str(plotted_fuel)
     return generated
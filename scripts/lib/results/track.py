@@ -1,10 +1,10 @@
 """Track extraction helpers for simulation result CSVs."""
 from __future__ import annotations
 
-import math
 from typing import Dict, List, Tuple
 
 from scripts.lib.common.csv import numeric_series, series_from_candidates
+from scripts.lib.common.geo import project_lat_lon_to_local_km
 
 
 def extract_track_points(
@@ -61,12 +61,8 @@ def extract_track_points(
             ],
         )
         if lats and lons:
-            lat0 = lats[0]
-            lon0 = lons[0]
-            lat0_rad = math.radians(lat0)
-            xs = [111.0 * (lat - lat0) for lat in lats]
-            ys = [111.0 * math.cos(lat0_rad) * (lon - lon0) for lon in lons]
+            xs, ys = project_lat_lon_to_local_km(lats, lons)
             zs = [alt / 1000.0 for alt in alts_m] if alts_m else [0.0 for _ in lats]
 
-    n = min(len(xs), len(ys), len(zs))
-    return [(xs[i], ys[i], zs[i]) for i in range(n)]
+    # zip stops at the shortest series, matching the old min-length slice.
+    return list(zip(xs, ys, zs))
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
-from scripts.lib.common.geo import destination_point, haversine_distance_km
+from scripts.lib.common.geo import destination_point
 
 
 @dataclass
@@ -20,7 +20,8 @@ class GeodeticLLA:
 
 def random_segments(count: int, total: float) -> List[float]:
     """Randomly split total distance into 'count' positive segments."""
-    weights = [random.random() + 0.1 for _ in range(count)]
+    rand = random.random
+    weights = [rand() + 0.1 for _ in range(count)]
     weight_sum = sum(weights)
     return [total * w / weight_sum for w in weights]
 
@@ -56,15 +57,9 @@ def generate_scenario(
         points.append(next_point)
         current = next_point
 
-    total_distance_calc = haversine_distance_km(
-        [
-            {
-                "latitude_deg": p.latitude_deg,
-                "longitude_deg": p.longitude_deg,
-            }
-            for p in points
-        ]
-    )
+    # Each leg was placed exactly distance_km along a great circle, so the path
+    # length is the sum of the segments; no second haversine pass is needed.
+    total_distance_calc = sum(segment_distances)
     return {
         "points": [
             {
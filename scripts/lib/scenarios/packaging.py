@@ -7,56 +7,79 @@ import zipfile
 from pathlib import Path
 import xml.etree.ElementTree as ET
 
+# Kept local: scripts.lib.common.formats imports the SysML parser, which the
+# simulation phase must not depend on.
+SSD_NAMESPACE = "http://ssp-standard.org/SSP1/SystemStructureDescription"
+SSC_NAMESPACE = "http://ssp-standard.org/SSP1/SystemStructureCommon"
+SSD_ENTRY = "SystemStructure.ssd"
+COPY_CHUNK_SIZE = 1024 * 1024
+PARAMETER_BINDINGS_TAG = f"{{{SSD_NAMESPACE}}}ParameterBindings"
+PARAMETER_BINDING_TAG = f"{{{SSD_NAMESPACE}}}ParameterBinding"
 
-def package_ssp_with_parameters(
-    ssp_path: Path,
-    parameter_set_path: Path,
-    scenario_stem: str,
-    results_dir: Path,
-) -> Path:
-    run_dir = results_dir / f"{scenario_stem}_run"
-    unpack_dir = run_dir / "unpacked"
-    if unpack_dir.exists():
-        shutil.rmtree(unpack_dir)
-    unpack_dir.mkdir(parents=True, exist_ok=True)
-
-    with zipfile.ZipFile(ssp_path, "r") as archive:
-        archive.extractall(unpack_dir)
-
-    resources_dir = unpack_dir / "resources"
-    resources_dir.mkdir(parents=True, exist_ok=True)
-    packaged_parameter_set_path = resources_dir / parameter_set_path.name
-    shutil.copy(parameter_set_path, packaged_parameter_set_path)
-
-    ssd_path = unpack_dir / "SystemStructure.ssd"
-    ssd_ns = "http://ssp-standard.org/SSP1/SystemStructureDescription"
-    ssc_ns = "http://ssp-standard.org/SSP1/SystemStructureCommon"
-    ET.register_namespace("ssd", ssd_ns)
-    ET.register_namespace("ssc", ssc_ns)
-    ns = {"ssd": ssd_ns}
-    tree = ET.parse(ssd_path)
-    root = tree.getroot()
+# Fixed entry metadata keeps prepared SSPs byte-identical for identical inputs.
+ARCHIVE_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+ARCHIVE_FILE_MODE = 0o100644
+
+
+def _archive_entry(name: str, compress_type: int = zipfile.ZIP_DEFLATED) -> zipfile.ZipInfo:
+    entry = zipfile.ZipInfo(name, date_time=ARCHIVE_DATE_TIME)
+    entry.compress_type = compress_type
+    entry.external_attr = ARCHIVE_FILE_MODE << 16
+    return entry
+
+
+def _bind_parameter_set(ssd_bytes: bytes, binding_source: str) -> bytes:
+    ET.register_namespace("ssd", SSD_NAMESPACE)
+    ET.register_namespace("ssc", SSC_NAMESPACE)
+    ns = {"ssd": SSD_NAMESPACE}
+    root = ET.fromstring(ssd_bytes)
     system = root.find(".//ssd:System", ns)
     if system is None:
         system = root
     bindings = system.find("ssd:ParameterBindings", ns)
     if bindings is None:
-        bindings = ET.SubElement(system, f"{{{ssd_ns}}}ParameterBindings")
+        bindings = ET.SubElement(system, PARAMETER_BINDINGS_TAG)
 
-    binding_source = f"resources/{packaged_parameter_set_path.name}"
     for existing in list(bindings):
         if existing.get("source") == binding_source:
             bindings.remove(existing)
 
-    ET.SubElement(bindings, f"{{{ssd_ns}}}ParameterBinding", attrib={"source": binding_source})
-    ET.indent(tree, space="  ")
-    tree.write(ssd_path, encoding="UTF-8", xml_declaration=True)
+    ET.SubElement(bindings, PARAMETER_BINDING_TAG, attrib={"source": binding_source})
+    ET.indent(root, space="  ")
+    return ET.tostring(root, encoding="UTF-8", xml_declaration=True)
+
+
+def package_ssp_with_parameters(
+    ssp_path: Path,
+    parameter_set_path: Path,
+    scenario_stem: str,
+    results_dir: Path,
+) -> Path:
+    run_dir = results_dir / f"{scenario_stem}_run"
+    run_dir.mkdir(parents=True, exist_ok=True)
+    parameter_set_entry = f"resources/{parameter_set_path.name}"
 
+    # Copy the baseline archive entry by entry so no unpacked tree has to be
+    # written, and later wiped, for every run.
     prepared_ssp_path = run_dir / f"{scenario_stem}.ssp"
-    if prepared_ssp_path.exists():
-        prepared_ssp_path.unlink()
-    with zipfile.ZipFile(prepared_ssp_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        for path in unpack_dir.rglob("*"):
-            if path.is_file():
-                archive.write(path, arcname=path.relative_to(unpack_dir))
+    with zipfile.ZipFile(ssp_path, "r") as source, zipfile.ZipFile(
+        prepared_ssp_path, "w", compression=zipfile.ZIP_DEFLATED
+    ) as archive:
+        for info in source.infolist():
+            if info.is_dir() or info.filename == parameter_set_entry:
+                continue
+            if info.filename == SSD_ENTRY:
+                archive.writestr(
+                    _archive_entry(info.filename), _bind_parameter_set(source.read(info), parameter_set_entry)
+                )
+                continue
+            # FMUs can carry large shared libraries; stream them instead of
+            # holding each one in memory. They are zip archives already, so
+            # deflating them again only burns CPU.
+            compress_type = zipfile.ZIP_STORED if info.filename.endswith(".fmu") else zipfile.ZIP_DEFLATED
+            entry = _archive_entry(info.filename, compress_type)
+            entry.file_size = info.file_size
+            with source.open(info) as src, archive.open(entry, "w") as dst:
+                shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+        archive.writestr(_archive_entry(parameter_set_entry), parameter_set_path.read_bytes())
     return prepared_ssp_path
@@ -19,6 +19,15 @@ from scripts.lib.paths import BUILD_DIR
 DEFAULT_SSP = BUILD_DIR / "ssp" / "aircraft.ssp"
 DEFAULT_RESULTS = BUILD_DIR / "results"
 
+PARAMETER_VALUES_NAMESPACE = "http://ssp-standard.org/SSP1/ParameterValues"
+PARAMETER_SET_TAG = f"{{{PARAMETER_VALUES_NAMESPACE}}}ParameterSet"
+PARAMETERS_TAG = f"{{{PARAMETER_VALUES_NAMESPACE}}}Parameters"
+PARAMETER_TAG = f"{{{PARAMETER_VALUES_NAMESPACE}}}Parameter"
+PARAMETER_VALUE_TAGS = {
+    type_tag: f"{{{PARAMETER_VALUES_NAMESPACE}}}{type_tag}"
+    for type_tag in ("Real", "Integer", "Boolean", "String")
+}
+
 
 @dataclass
 class PreparedScenario:
@@ -69,14 +78,14 @@ def emit_waypoint_parameter_set(
     control_component: str = "control_interface",
     enable_bridge_input: bool = False,
 ) -> Path:
-    ns = "http://ssp-standard.org/SSP1/ParameterValues"
-    ET.register_namespace("ssv", ns)
-    root = ET.Element(f"{{{ns}}}ParameterSet", attrib={"name": "Waypoints"})
-    params = ET.SubElement(root, f"{{{ns}}}Parameters")
+    ET.register_namespace("ssv", PARAMETER_VALUES_NAMESPACE)
+    root = ET.Element(PARAMETER_SET_TAG, attrib={"name": "Waypoints"})
+    params = ET.SubElement(root, PARAMETERS_TAG)
 
     def add_param(name: str, type_tag: str, value: str) -> None:
-        param_elem = ET.SubElement(params, f"{{{ns}}}Parameter", attrib={"name": name})
-        value_elem = ET.SubElement(param_elem, f"{{{ns}}}{type_tag}")
+        param_elem = ET.SubElement(params, PARAMETER_TAG)
+        param_elem.set("name", name)
+        value_elem = ET.SubElement(param_elem, PARAMETER_VALUE_TAGS[type_tag])
         value_elem.set("value", value)
 
     add_param(f"{control_component}.useBridgeInput", "Boolean", "true" if enable_bridge_input else "false")
@@ -97,10 +106,9 @@ def emit_waypoint_parameter_set(
 
     add_param(f"{component}.waypointCount", "Integer", str(len(local_points) - 1))
 
-    tree = ET.ElementTree(root)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    ET.indent(tree, space="  ", level=0)
-    tree.write(output_path, encoding="UTF-8", xml_declaration=True)
+    ET.indent(root, space="  ", level=0)
+    output_path.write_bytes(ET.tostring(root, encoding="UTF-8", xml_declaration=True))
     return output_path
 
 
@@ -17,6 +17,8 @@ INTERFACE_DECL_RE = re.compile(
     r"\b(?P<direction>input|output)\s+GI\.(?P<record>\w+)\s+(?P<var>\w+)",
     re.MULTILINE,
 )
+# The lookahead keeps the field unconsumed so chained accesses (a.b.c) also yield b.c.
+MEMBER_ACCESS_RE = re.compile(r"\b(?P<var>\w+)\.(?=(?P<field>\w+))")
 
 
 def _collect_architecture_data(
@@ -39,6 +41,13 @@ def _collect_architecture_data(
     return members, part_ports
 
 
+def _member_accesses(text: str) -> Dict[str, Set[str]]:
+    accesses: Dict[str, Set[str]] = {}
+    for match in MEMBER_ACCESS_RE.finditer(text):
+        accesses.setdefault(match.group("var"), set()).add(match.group("field"))
+    return accesses
+
+
 def _scan_file(
     path: Path,
     members: Dict[str, Set[str]],
@@ -51,6 +60,7 @@ def _scan_file(
         return issues
     part_name = path.stem
     ports = part_ports.get(part_name)
+    accesses = _member_accesses(text)
     for match in declarations:
         direction = match.group("direction")
         record = match.group("record")
@@ -59,7 +69,7 @@ def _scan_file(
             issues.append(f"{path}: Interface {record} referenced by {var} "
                           "is not present in architecture definitions.")
             continue
-        used = set(re.findall(rf"\b{re.escape(var)}\.(\w+)", text))
+        used = accesses.get(var, set())
         missing = sorted(field for field in used if field not in members[record])
         if missing:
             formatted = ", ".join(missing)
@@ -28,6 +28,18 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Run simulation",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of FMU builds CMake may run concurrently",
+    )
+    parser.add_argument(
+        "--scratch-dir",
+        type=Path,
+        default=BUILD_DIR / "tmp",
+        help="Scratch directory for omc code generation and FMU/SSP staging (e.g. a tmpfs path)",
+    )
 
     args = parser.parse_args(argv)
 
@@ -67,6 +79,7 @@ def main(argv: list[str] | None = None) -> int:
         "-B",
         str(cmake_build_dir),
         f"-DOMC_EXECUTABLE={omc_path}",
+        f"-DAIRPLANE_TMP_DIR={args.scratch_dir}",
     )
 
     print("Building and packaging FMUs and the baseline SSP...")
@@ -74,6 +87,8 @@ def main(argv: list[str] | None = None) -> int:
         "cmake",
         "--build",
         str(cmake_build_dir),
+        "--parallel",
+        str(args.jobs),
     )
 
     print("Testing native FlightGear bridge FMU...")
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import math
 import shutil
+import xml.etree.ElementTree as ET
+import zipfile
 from pathlib import Path
 import pytest
 import sys
@@ -88,6 +90,46 @@ def test_prepare_and_analyze_produce_summary_and_requirements(tmp_path):
     assert summary_path.exists()
 
 
+def test_package_ssp_with_parameters_binds_parameter_set_deterministically(tmp_path):
+    ssd_ns = "http://ssp-standard.org/SSP1/SystemStructureDescription"
+    fmu_bytes = bytes(range(256)) * 64
+    baseline_ssp = tmp_path / "baseline.ssp"
+    with zipfile.ZipFile(baseline_ssp, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(
+            "SystemStructure.ssd",
+            f'<ssd:SystemStructureDescription xmlns:ssd="{ssd_ns}" name="x" version="1.0">'
+            '<ssd:System name="AircraftComposition"/></ssd:SystemStructureDescription>',
+        )
+        archive.writestr("resources/", "")
+        archive.writestr("resources/Aircraft.fmu", fmu_bytes)
+        archive.writestr("resources/waypoints.ssv", "<stale/>")
+
+    parameter_set_path = tmp_path / "waypoints.ssv"
+    parameter_set_path.write_text("<ssv:ParameterSet/>")
+    results_dir = tmp_path / "results"
+
+    first = package_ssp_with_parameters(baseline_ssp, parameter_set_path, "scenario", results_dir)
+    first_bytes = first.read_bytes()
+    second = package_ssp_with_parameters(baseline_ssp, parameter_set_path, "scenario", results_dir)
+
+    assert second.read_bytes() == first_bytes
+    assert sorted(path.name for path in first.parent.iterdir()) == ["scenario.ssp"]
+
+    with zipfile.ZipFile(first) as archive:
+        names = archive.namelist()
+        assert names.count("resources/waypoints.ssv") == 1
+        assert archive.read("resources/waypoints.ssv") == parameter_set_path.read_bytes()
+
+        fmu_info = archive.getinfo("resources/Aircraft.fmu")
+        assert fmu_info.compress_type == zipfile.ZIP_STORED
+        assert archive.read(fmu_info) == fmu_bytes
+        assert all(info.date_time == (1980, 1, 1, 0, 0, 0) for info in archive.infolist())
+
+        root = ET.fromstring(archive.read("SystemStructure.ssd"))
+    bindings = root.findall(".//ssd:ParameterBinding", {"ssd": ssd_ns})
+    assert [binding.get("source") for binding in bindings] == ["resources/waypoints.ssv"]
+
+
 def test_analyze_scenario_results_writes_summary(tmp_path):
     scenario_path = REPO_ROOT / "build" / "scenarios" / "test_scenario.json"
     source_results = REPO_ROOT / "build" / "results" / "test_scenario_results.csv"